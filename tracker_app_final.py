@@ -2,17 +2,238 @@
 # sqlite3: This provides access to use SQLite databases (db).
 # datetime: This allows validating and managing date formats.
 # os: Is used for file operations like checking the existence of a database.
+# functools: Lets the db connection be cached and reused by every function.
+# atexit: Closes the shared db connection when the program ends.
+# sys: Writes long listings to the screen in one go.
+# re: Checks that typed-in amounts look like numbers.
+# itertools: Splits bulk inserts into chunks without copying all the rows.
+# decimal: Rounds amounts to whole pennies exactly.
 import sqlite3
-from datetime import datetime
+from datetime import date, datetime
+from decimal import Decimal, ROUND_HALF_UP
 import os
+import functools
+import atexit
+import sys
+import re
+import itertools
+
+# The db file the program works with. One connection to it is opened on
+# first use and shared by every function until the program exits.
+DB_PATH = "Spend_Wise_Buddy.db"
+
+# Version of the db layout set up by build_a_financial_db. It is saved in the
+# db's user_version, so a db that is already up to date is not set up again.
+# Raise it whenever a table, index, trigger or conversion is changed.
+SCHEMA_VERSION = 1
+
+# SQL statements that are run often. Keeping them as constants means
+# sqlite3 sees the exact same text each time, so it can reuse the already
+# prepared statement from its cache.
+# The table holding each type of category.
+CATEGORY_TABLES = {"income": "income_categories",
+                   "expense": "expense_categories"}
+# One category lookup statement per category type, built once at start up.
+SQL_CATEGORY_EXISTS = {
+    category_type: f"SELECT 1 FROM {table} WHERE name_of_category = ?"
+    for category_type, table in CATEGORY_TABLES.items()
+}
+# One category insert statement per category type, also built once. An
+# existing name is skipped, and RETURNING gives a row only if one was added.
+SQL_INSERT_CATEGORY = {
+    category_type: (f"INSERT OR IGNORE INTO {table} (name_of_category, "
+                    "description) VALUES (?, ?) RETURNING 1")
+    for category_type, table in CATEGORY_TABLES.items()
+}
+SQL_INSERT_EXPENSE = ("INSERT INTO users_expenses (date_of_spending, "
+                      "type_of_spending, amount_spent_pennies) "
+                      "VALUES (?, ?, ?)")
+SQL_INSERT_INCOME = ("INSERT INTO users_incomes (source_of_income, "
+                     "sum_of_income_pennies, date_of_income) "
+                     "VALUES (?, ?, ?)")
+SQL_INSERT_GOAL = ("INSERT INTO saving_goals (name_of_goal, "
+                   "monthly_target_amount_pennies, saved_up_so_far_pennies, "
+                   "commencing_day, finish_day) VALUES (?, ?, 0, ?, ?)")
+# Sets a category's budget, changing it in place if one is already set.
+SQL_UPSERT_BUDGET = ("INSERT INTO budget_calculator (name_of_category, "
+                     "budget_value_pennies, type_of_category) "
+                     "VALUES (?, ?, ?) "
+                     "ON CONFLICT (name_of_category) DO UPDATE SET "
+                     "budget_value_pennies = excluded.budget_value_pennies, "
+                     "type_of_category = excluded.type_of_category")
+# Listing expense and income records, in pounds, with optional filters.
+# The filtered listings may be read through an index sorted by amount, so
+# they ask for ID order to list the records in the order they were saved.
+SQL_SELECT_EXPENSES = ("SELECT id, date_of_spending, type_of_spending, "
+                       "amount_spent_pennies / 100.0 FROM users_expenses")
+SQL_SELECT_EXPENSES_BY_TYPE = (SQL_SELECT_EXPENSES
+                               + " WHERE type_of_spending = ? ORDER BY id")
+SQL_SELECT_EXPENSES_BY_DATE = (SQL_SELECT_EXPENSES
+                               + " WHERE date_of_spending = ? ORDER BY id")
+SQL_SELECT_EXPENSE_BY_ID = SQL_SELECT_EXPENSES + " WHERE id = ?"
+SQL_UPDATE_EXPENSE_AMOUNT = ("UPDATE users_expenses "
+                             "SET amount_spent_pennies = ? WHERE id = ?")
+SQL_EXPENSE_TYPE_EXISTS = ("SELECT EXISTS(SELECT 1 FROM users_expenses "
+                           "WHERE type_of_spending = ? LIMIT 1)")
+SQL_DELETE_EXPENSE_TYPE = ("DELETE FROM users_expenses "
+                           "WHERE type_of_spending = ?")
+SQL_SELECT_INCOMES = ("SELECT id, source_of_income, "
+                      "sum_of_income_pennies / 100.0, date_of_income "
+                      "FROM users_incomes")
+SQL_SELECT_INCOMES_BY_SOURCE = (SQL_SELECT_INCOMES
+                                + " WHERE source_of_income = ? ORDER BY id")
+SQL_SELECT_INCOME_BY_ID = SQL_SELECT_INCOMES + " WHERE id = ? LIMIT 1"
+SQL_INCOME_SOURCE_EXISTS = ("SELECT EXISTS(SELECT 1 FROM users_incomes "
+                            "WHERE source_of_income = ? LIMIT 1)")
+SQL_DELETE_INCOME_SOURCE = ("DELETE FROM users_incomes "
+                            "WHERE source_of_income = ?")
+# Reading a savings goal and adding to its saved amount. Goal names are not
+# unique, so the first goal with the name is shown and its ID is used to
+# update that same goal only.
+SQL_SELECT_GOAL = ("SELECT goal_ID_No, monthly_target_amount_pennies / 100.0, "
+                   "saved_up_so_far_pennies / 100.0, "
+                   "commencing_day, finish_day "
+                   "FROM saving_goals WHERE name_of_goal = ? "
+                   "ORDER BY goal_ID_No LIMIT 1")
+SQL_ADD_GOAL_SAVINGS = ("UPDATE saving_goals SET saved_up_so_far_pennies = "
+                        "saved_up_so_far_pennies + ? WHERE goal_ID_No = ? "
+                        "RETURNING saved_up_so_far_pennies / 100.0")
+
+# Total expenses and total income for one month or one year. Each timeframe
+# maps to the date format of its period and one fixed statement for it.
+# If there are none, COALESCE sets the value to 0.
+SQL_SUMMARY = {
+    timeframe: (date_format, (
+        "SELECT (SELECT COALESCE(SUM(amount_spent_pennies), 0) / 100.0 "
+        f"FROM users_expenses WHERE strftime('{date_format}', "
+        "date_of_spending) = ?), "
+        "(SELECT COALESCE(SUM(sum_of_income_pennies), 0) / 100.0 "
+        f"FROM users_incomes WHERE strftime('{date_format}', "
+        "date_of_income) = ?)"
+    ))
+    for timeframe, date_format in (("monthly", "%Y-%m"), ("annually", "%Y"))
+}
+
+# How each income record is shown, followed by a blank line. The fields are
+# (id, source_of_income, sum_of_income, date_of_income).
+INCOME_RECORD_FORMAT = ("🆔 ID: {0}, 🗓️ Date: {3}, 📌 Source: {1}, "
+                        "💰 Amount: £{2:.2f}\n\n")
+
+# Number of rows saved per transaction when many records are added at once.
+BULK_INSERT_CHUNK_SIZE = 10000
+
+# Number of records read and written to the screen at a time when listing
+# records, so a long history is never held in memory all at once.
+DISPLAY_BATCH_SIZE = 1000
+
+# Number of records changed per UPDATE when many incomes are edited at once.
+# Each record binds three values, which keeps one statement well under
+# SQLite's limit of 999 bound values on older versions.
+BULK_UPDATE_CHUNK_SIZE = 300
+
+# Number of SQLite virtual machine steps between calls to the progress
+# handler while a report runs. Each call gives Python the chance to notice
+# Ctrl+C, so a long report can be cancelled without quitting the app.
+REPORT_PROGRESS_STEPS = 10000
+
+# A typed-in amount in pounds, e.g. "12", "12.50" or ".5". Signs, exponents
+# and words such as "nan" or "inf" are not accepted, and _parse_amount also
+# turns away anything above MAX_AMOUNT, such as a string of digits too long
+# to be held as a float.
+_POSITIVE_DECIMAL = re.compile(r"\d+(?:\.\d*)?|\.\d+")
+
+# The largest amount, in pounds, the program will store. Its pennies fit
+# easily in SQLite's 64-bit integers and stay exact when shown as pounds.
+MAX_AMOUNT = 10 ** 12
+
+# A date shaped like YYYY-MM-DD, written with the digits 0-9.
+_ISO_DATE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+
+# Each menu's text, written to the screen in one go every time it is shown.
+MAIN_MENU_TEXT = (
+    "\n✨ Hello, annyeonghaseyo and Welcome to Spend Wise Buddy! ✨\n"
+    "1️⃣  Expenses (Register, View, Update, Delete 📝📊🔍)\n"
+    "2️⃣  Income (Register, View, Update, Delete 💵💰🔎)\n"
+    "3️⃣  Budget Management (Set and view budgets 🎯🏦)\n"
+    "4️⃣  Financial Goals (Set and track your financial goals 🚀)\n"
+    "5️⃣  Reports & Trends (Summaries, Breakdown & trends 📈)\n"
+    "6️⃣  Quit Program (Exit the application ❌)\n")
+
+EXPENSES_MENU_TEXT = (
+    "\n-- Expenses Menu --\n"
+    "1️⃣ Add new expense 📝\n"
+    "2️⃣ Add a new expense category 🏷️\n"
+    "3️⃣ View expenses 📊\n"
+    "4️⃣ Update an expense 🔄\n"
+    "5️⃣ Delete an expense category 🚫\n"
+    "6️⃣ Bulk add expenses 🧾\n"
+    "0️⃣ Return to Main Menu 🔙\n")
+
+INCOME_MENU_TEXT = (
+    "\n-- Income Menu --\n"
+    "1️⃣ Add income 💵\n"
+    "2️⃣ Add a new income category 🏷️\n"
+    "3️⃣ View income 💰\n"
+    "4️⃣ Update income 💼\n"
+    "5️⃣ Delete an income category 🚫\n"
+    "0️⃣ Return to Main Menu 🔙\n")
+
+BUDGET_MENU_TEXT = (
+    "\n-- Budget Management Menu --\n"
+    "1️⃣ Set budget for a category 🎯\n"
+    "2️⃣ View budget for a category 🏦\n"
+    "3️⃣ Magical budget calculator 🧙🪄\n"
+    "0️⃣ Return to Main Menu 🔙\n")
+
+GOALS_MENU_TEXT = (
+    "\n-- Financial Goals Menu --\n"
+    "1️⃣ Set a personalised financial goal 🚀\n"
+    "2️⃣ View or update savings progress 📈\n"
+    "0️⃣ Return to Main Menu 🔙\n")
+
+REPORTS_MENU_TEXT = (
+    "\n-- Reports & Trends Menu --\n"
+    "1️⃣ View income and expense summary 📊 (Monthly/Annual)\n"
+    "2️⃣ Track spending trends 📉\n"
+    "3️⃣ View spending and income by category 🔍\n"
+    "0️⃣ Return to Main Menu 🔙\n")
+
+# Rows returned by the report queries, keyed by report and period, so that
+# browsing the reports again does not re-run the same SUMs. The cache is
+# emptied as soon as anything has been written to the db since it was filled.
+_SUMMARY_CACHE = {}
+
+
+def _configure_connection(link_to_db):
+    """Applies the program's PRAGMA settings to a new db connection.
+
+    WAL mode with synchronous=NORMAL avoids a full disk sync on every
+    insert, and the larger cache and memory-mapped reads keep frequently
+    used pages in memory. busy_timeout makes SQLite wait up to 5 seconds
+    for a lock held by another program instead of failing straight away.
 
+    Args:
+        link_to_db (sqlite3.Connection): The connection to set up.
+    """
+    link_to_db.execute("PRAGMA journal_mode=WAL")
+    link_to_db.execute("PRAGMA synchronous=NORMAL")
+    link_to_db.execute("PRAGMA temp_store=MEMORY")
+    link_to_db.execute("PRAGMA cache_size=-64000")
+    link_to_db.execute("PRAGMA mmap_size=268435456")
+    link_to_db.execute("PRAGMA busy_timeout=5000")
 
+
+@functools.lru_cache(maxsize=1)
 def link_to_finance_db():
     """
     This function links to the SQLite database called Spend_Wise_Buddy
     and manages any errors. Allows interaction with the database
     throughout the program without repeatedly starting new connections.
 
+    The connection is only opened on the first call. Every call after that
+    returns the same cached connection, so it must not be closed by the
+    callers. It is closed automatically when the program exits.
+
     Returns:
         sqlite3.Connection: Database connection is successful.
         None: Failure to connect to the database. Meaning the program
@@ -22,8 +243,21 @@ def link_to_finance_db():
         sqlite3.Error: Spots and manages database connection failures.
     """
     try:
-        # Link to the db.
-        return sqlite3.connect("Spend_Wise_Buddy.db")
+        # Link to the db once and reuse it for the rest of the program.
+        # A bigger statement cache keeps all the program's queries prepared.
+        # isolation_level=None turns off the sqlite3 module's implicit
+        # BEGIN, so every write path opens its own transaction explicitly.
+        link_to_db = sqlite3.connect(DB_PATH, isolation_level=None,
+                                     cached_statements=512)
+
+        # Tune the db once per program run.
+        _configure_connection(link_to_db)
+
+        # Exit handlers run in reverse order, so PRAGMA optimize refreshes
+        # the planner's statistics (only if needed) before the db is closed.
+        atexit.register(link_to_db.close)
+        atexit.register(link_to_db.execute, "PRAGMA optimize")
+        return link_to_db
     except sqlite3.Error as e:
         print(f"Oops! Failed to connect to the database ❌: {e}")
         # If db connection fails, it terminates the program.
@@ -43,12 +277,16 @@ def build_a_financial_db():
     1. It first checks for the existence of the database and if not
     it will create a new one.
     2. It then establishes a connection with the database.
-    3. It then defines the required tables in SQL statements.
-    4. It then executes SQL commands to create the tables if they are not
-    created yet.
-    5. It then commits the changes and close the connection.
+    3. If the db's user_version already matches SCHEMA_VERSION, the db is
+    up to date and nothing else is done.
+    4. It then defines the required tables in SQL statements.
+    5. It then executes SQL commands to create the tables if they are not
+    created yet, convert tables from older versions, and add the indexes
+    and triggers.
+    6. It then commits the changes, records SCHEMA_VERSION and keeps the
+    connection open.
     """
-    if not os.path.exists("Spend_Wise_Buddy.db"):
+    if not os.path.exists(DB_PATH):
         print("Generating database...")
     else:
         print("Existing database found already, skipping setup.")
@@ -65,29 +303,37 @@ def build_a_financial_db():
     # Allows generating a cursor to execute SQL.
     link_to_db_cursor = link_to_db.cursor()
 
-    # Generating a table for users' spending.
-    link_to_db_cursor.execute('''CREATE TABLE IF NOT EXISTS users_expenses (
-                              id INTEGER PRIMARY KEY AUTOINCREMENT,
-                              date_of_spending TEXT NOT NULL,
-                              type_of_spending TEXT NOT NULL,
-                              amount_spent REAL NOT NULL)''')
+    # A db already set up by this version of the program needs nothing
+    # more. user_version lives in the db file's header, so this is a single
+    # quick read instead of re-running every CREATE statement.
+    link_to_db_cursor.execute("PRAGMA user_version")
+    if link_to_db_cursor.fetchone()[0] >= SCHEMA_VERSION:
+        return
 
     # Organising data entities within financial tables to ensure structured
     # storage.
     the_database_entities = {
+        # Table for users' spending.
+        "users_expenses": '''CREATE TABLE IF NOT EXISTS users_expenses (
+                              id INTEGER PRIMARY KEY AUTOINCREMENT,
+                              date_of_spending TEXT NOT NULL,
+                              type_of_spending TEXT NOT NULL COLLATE NOCASE,
+                              amount_spent_pennies INTEGER NOT NULL)''',
+
         # Table to track user income records, inc source, amount and date.
         "users_incomes": '''CREATE TABLE IF NOT EXISTS users_incomes (
                             id INTEGER PRIMARY KEY AUTOINCREMENT,
-                            source_of_income TEXT NOT NULL,
-                            sum_of_income REAL NOT NULL,
+                            source_of_income TEXT NOT NULL COLLATE NOCASE,
+                            sum_of_income_pennies INTEGER NOT NULL,
                             date_of_income DATE NOT NULL)''',
 
         # Table to determine the user's budget using their income and spending.
         "budget_calculator": '''CREATE TABLE IF NOT EXISTS budget_calculator (
-                            name_of_category TEXT PRIMARY KEY,
-                            budget_value REAL NOT NULL,
+                            name_of_category TEXT PRIMARY KEY COLLATE NOCASE,
+                            budget_value_pennies INTEGER NOT NULL,
                             type_of_category TEXT CHECK(type_of_category
-                            IN ('income', 'expense')) NOT NULL,
+                            IN ('income', 'expense')) NOT NULL
+                            COLLATE NOCASE,
                             income_category_name TEXT,
                             expense_category_name TEXT,
                             FOREIGN KEY (income_category_name) REFERENCES
@@ -100,42 +346,277 @@ def build_a_financial_db():
         # Table for monitoring user's savings goals and their progress.
         "saving_goals": '''CREATE TABLE IF NOT EXISTS saving_goals (
                     goal_ID_No INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name_of_goal TEXT NOT NULL,
-                    commencing_date DATE,
-                    finish_date DATE,
-                    monthly_target_amount REAL NOT NULL,
-                    saved_up_so_far REAL NOT NULL)''',
+                    name_of_goal TEXT NOT NULL COLLATE NOCASE,
+                    commencing_day INTEGER,
+                    finish_day INTEGER,
+                    monthly_target_amount_pennies INTEGER NOT NULL,
+                    saved_up_so_far_pennies INTEGER NOT NULL)''',
 
 
         # Table to organise various income categories.
         "income_categories": '''CREATE TABLE IF NOT EXISTS income_categories (
-                            name_of_category TEXT PRIMARY KEY,
+                            name_of_category TEXT PRIMARY KEY COLLATE NOCASE,
                             description TEXT)''',
 
         # Table to organise various expense categories.
         "expense_categories": '''CREATE TABLE IF NOT EXISTS
                               expense_categories
-                              (name_of_category TEXT PRIMARY KEY,
-                              description TEXT)'''
+                              (name_of_category TEXT PRIMARY KEY
+                              COLLATE NOCASE, description TEXT)''',
+
+        # Table keeping the running total income and total expenses (in
+        # pennies), so the budget calculator does not have to add up every
+        # record each time.
+        "totals": '''CREATE TABLE IF NOT EXISTS totals (
+                   kind TEXT PRIMARY KEY CHECK(kind IN ('income', 'expense')),
+                   value INTEGER NOT NULL)'''
         }
 
-    # Executing SQL commands to generate tables for financial tracking.
-    for table_name, query in the_database_entities.items():
-        link_to_db_cursor.execute(query)
+    # Indexes that match the filters used when searching the tables, so
+    # SQLite can find rows without scanning the whole table. Text columns
+    # are declared COLLATE NOCASE, so these indexes also serve
+    # case-insensitive searches. Budgets are found through their primary key.
+    # The indexes used by the reports also hold the amount, so the totals
+    # are added up from the index alone without reading the table rows.
+    the_database_indexes = {
+        # Expenses searched by type or by date. The breakdown by type sums
+        # the amounts per type.
+        "idx_exp_type_amount": '''CREATE INDEX IF NOT EXISTS
+                        idx_exp_type_amount
+                        ON users_expenses
+                        (type_of_spending, amount_spent_pennies)''',
+        "idx_exp_date": '''CREATE INDEX IF NOT EXISTS idx_exp_date
+                        ON users_expenses (date_of_spending)''',
+
+        # Incomes searched by source or by date. The breakdown by source
+        # sums the amounts per source.
+        "idx_inc_source_amount": '''CREATE INDEX IF NOT EXISTS
+                          idx_inc_source_amount
+                          ON users_incomes
+                          (source_of_income, sum_of_income_pennies)''',
+        "idx_inc_date": '''CREATE INDEX IF NOT EXISTS idx_inc_date
+                        ON users_incomes (date_of_income)''',
+
+        # Monthly and annual summaries and trends filter and group by the
+        # month or year of the date, and sum the amounts. The date itself
+        # is kept last so SQLite knows the index holds every column used.
+        "idx_exp_month_amount": '''CREATE INDEX IF NOT EXISTS
+                         idx_exp_month_amount ON users_expenses
+                         (strftime('%Y-%m', date_of_spending),
+                         amount_spent_pennies, date_of_spending)''',
+        "idx_exp_year_amount": '''CREATE INDEX IF NOT EXISTS
+                        idx_exp_year_amount ON users_expenses
+                        (strftime('%Y', date_of_spending),
+                        amount_spent_pennies, date_of_spending)''',
+        "idx_inc_month_amount": '''CREATE INDEX IF NOT EXISTS
+                         idx_inc_month_amount ON users_incomes
+                         (strftime('%Y-%m', date_of_income),
+                         sum_of_income_pennies, date_of_income)''',
+        "idx_inc_year_amount": '''CREATE INDEX IF NOT EXISTS
+                        idx_inc_year_amount ON users_incomes
+                        (strftime('%Y', date_of_income),
+                        sum_of_income_pennies, date_of_income)'''
+        }
+
+    # Triggers that keep the totals table up to date whenever an income or
+    # expense record is added, changed or deleted.
+    the_database_triggers = {
+        "trg_income_insert": '''CREATE TRIGGER IF NOT EXISTS
+                 trg_income_insert AFTER INSERT ON users_incomes
+                 BEGIN UPDATE totals
+                 SET value = value + NEW.sum_of_income_pennies
+                 WHERE kind = 'income'; END''',
+        "trg_income_update": '''CREATE TRIGGER IF NOT EXISTS
+                 trg_income_update AFTER UPDATE OF sum_of_income_pennies
+                 ON users_incomes
+                 BEGIN UPDATE totals SET value = value
+                 - OLD.sum_of_income_pennies + NEW.sum_of_income_pennies
+                 WHERE kind = 'income'; END''',
+        "trg_income_delete": '''CREATE TRIGGER IF NOT EXISTS
+                 trg_income_delete AFTER DELETE ON users_incomes
+                 BEGIN UPDATE totals
+                 SET value = value - OLD.sum_of_income_pennies
+                 WHERE kind = 'income'; END''',
+
+        "trg_expense_insert": '''CREATE TRIGGER IF NOT EXISTS
+                 trg_expense_insert AFTER INSERT ON users_expenses
+                 BEGIN UPDATE totals
+                 SET value = value + NEW.amount_spent_pennies
+                 WHERE kind = 'expense'; END''',
+        "trg_expense_update": '''CREATE TRIGGER IF NOT EXISTS
+                 trg_expense_update AFTER UPDATE OF amount_spent_pennies
+                 ON users_expenses
+                 BEGIN UPDATE totals SET value = value
+                 - OLD.amount_spent_pennies + NEW.amount_spent_pennies
+                 WHERE kind = 'expense'; END''',
+        "trg_expense_delete": '''CREATE TRIGGER IF NOT EXISTS
+                 trg_expense_delete AFTER DELETE ON users_expenses
+                 BEGIN UPDATE totals
+                 SET value = value - OLD.amount_spent_pennies
+                 WHERE kind = 'expense'; END'''
+        }
+
+    # Start the running totals from the records already saved. This only
+    # happens when the totals table is empty.
+    the_totals_seed = '''INSERT OR IGNORE INTO totals (kind, value)
+           SELECT 'income', COALESCE(SUM(sum_of_income_pennies), 0)
+           FROM users_incomes
+           UNION ALL
+           SELECT 'expense', COALESCE(SUM(amount_spent_pennies), 0)
+           FROM users_expenses'''
+
+    # Executing SQL commands to generate tables for financial tracking. All
+    # the statements go to SQLite as one script, inside one transaction, so
+    # the setup is saved to disk in a single commit.
+    link_to_db_cursor.executescript(
+        ";\n".join(["BEGIN", *the_database_entities.values(), "COMMIT"]) + ";"
+    )
+
+    # Tables from older versions of the program are converted in their own
+    # transaction. Each conversion only runs if the old column is still
+    # there, so it is safe to repeat.
+    link_to_db_cursor.execute("BEGIN")
+
+    # Older databases stored amounts as REAL pounds. Each of those columns
+    # is swapped for a new INTEGER column of pennies, so the values are
+    # stored as integers from now on. The conversion uses _to_pennies, so
+    # old amounts round the same way as newly typed ones.
+    link_to_db.create_function("to_pennies", 1, _to_pennies,
+                               deterministic=True)
+    totals_outdated = False
+    for table_name, old_column in (("users_expenses", "amount_spent"),
+                                   ("users_incomes", "sum_of_income"),
+                                   ("budget_calculator", "budget_value"),
+                                   ("saving_goals", "monthly_target_amount"),
+                                   ("saving_goals", "saved_up_so_far")):
+        link_to_db_cursor.execute(f"PRAGMA table_info({table_name})")
+        if old_column not in [column[1] for column in link_to_db_cursor]:
+            continue
+
+        # Older versions accepted any number, including inf. Amounts beyond
+        # MAX_AMOUNT either way are capped at it, and the user is told.
+        link_to_db_cursor.execute(
+            f"SELECT COUNT(*) FROM {table_name} "
+            f"WHERE ABS({old_column}) > ?", (MAX_AMOUNT,)
+        )
+        amounts_capped = link_to_db_cursor.fetchone()[0]
+        if amounts_capped:
+            print(f"🚩 {amounts_capped} amount(s) in {table_name} were too "
+                  f"large to keep and have been capped at £{MAX_AMOUNT:,}.")
+
+        new_column = f"{old_column}_pennies"
+        link_to_db_cursor.execute(
+            f"ALTER TABLE {table_name} "
+            f"ADD COLUMN {new_column} INTEGER NOT NULL DEFAULT 0"
+        )
+        link_to_db_cursor.execute(
+            f"UPDATE {table_name} SET {new_column} = "
+            f"to_pennies(MIN(MAX({old_column}, ?), ?))",
+            (-MAX_AMOUNT, MAX_AMOUNT)
+        )
+        link_to_db_cursor.execute(
+            f"ALTER TABLE {table_name} DROP COLUMN {old_column}"
+        )
+        totals_outdated = True
+
+    # Older databases stored goal dates as YYYY-MM-DD text. Rename those
+    # columns and convert their values to day numbers, the same numbers
+    # date.toordinal() gives (julianday of 0001-01-01 is 1721425.5).
+    link_to_db_cursor.execute("PRAGMA table_info(saving_goals)")
+    if "commencing_date" in [column[1] for column in link_to_db_cursor]:
+        for old_column, new_column in (("commencing_date", "commencing_day"),
+                                       ("finish_date", "finish_day")):
+            link_to_db_cursor.execute(
+                f"ALTER TABLE saving_goals "
+                f"RENAME COLUMN {old_column} TO {new_column}"
+            )
+            link_to_db_cursor.execute(
+                f"UPDATE saving_goals SET {new_column} = "
+                f"CAST(julianday({new_column}) - 1721424.5 AS INTEGER)"
+            )
+
+    # Older databases made their name columns without COLLATE NOCASE, so
+    # searching for "food" would miss a saved "Food". SQLite cannot change
+    # a column's collation in place, so each such table is copied into a
+    # new one made from the current CREATE statement, which then replaces
+    # it. Names that only differ in case keep the first one saved.
+    for table_name in ("users_expenses", "users_incomes",
+                       "budget_calculator", "saving_goals",
+                       "income_categories", "expense_categories"):
+        link_to_db_cursor.execute("SELECT sql FROM sqlite_master "
+                                  "WHERE name = ?", (table_name,))
+        if "NOCASE" in link_to_db_cursor.fetchone()[0].upper():
+            continue
+
+        new_table = f"{table_name}_new"
+        link_to_db_cursor.execute(
+            the_database_entities[table_name].replace(table_name, new_table,
+                                                      1)
+        )
+        link_to_db_cursor.execute(f"PRAGMA table_info({new_table})")
+        columns = ", ".join(column[1] for column in link_to_db_cursor)
+        link_to_db_cursor.execute(
+            f"INSERT OR IGNORE INTO {new_table} ({columns}) "
+            f"SELECT {columns} FROM {table_name} ORDER BY rowid"
+        )
+
+        # Keep counting IDs on from the old table, so IDs of deleted
+        # records are not given out again.
+        link_to_db_cursor.execute(
+            "UPDATE sqlite_sequence SET seq = (SELECT MAX(seq) "
+            "FROM sqlite_sequence WHERE name IN (?, ?)) WHERE name = ?",
+            (table_name, new_table, new_table)
+        )
+
+        # Dropping the old table also drops its indexes and triggers. They
+        # are made again by the last step of the setup.
+        link_to_db_cursor.execute(f"DROP TABLE {table_name}")
+        link_to_db_cursor.execute(
+            f"ALTER TABLE {new_table} RENAME TO {table_name}"
+        )
+        totals_outdated = True
+
+    # The running totals are cleared so they are rebuilt from the converted
+    # amounts and the copied records below.
+    if totals_outdated:
+        link_to_db_cursor.execute("DELETE FROM totals")
 
-    # Before disconnecting from the db, all modifications are saved.
     link_to_db.commit()
-    link_to_db.close()
+
+    # Executing SQL commands to generate the indexes, the running totals and
+    # the triggers for the totals as one more script. The schema version is
+    # saved in the same transaction, so it is only recorded once the whole
+    # setup has been committed. The connection stays open to be reused.
+    link_to_db_cursor.executescript(";\n".join([
+        "BEGIN",
+        *the_database_indexes.values(),
+        the_totals_seed,
+        *the_database_triggers.values(),
+        f"PRAGMA user_version = {SCHEMA_VERSION}",
+        "COMMIT"
+    ]) + ";")
+
+    # Gather statistics about the tables and indexes the first time, so the
+    # query planner knows which index suits each search. After that,
+    # PRAGMA optimize keeps them up to date when the program exits.
+    link_to_db_cursor.execute("SELECT 1 FROM sqlite_master "
+                              "WHERE name = 'sqlite_stat1'")
+    if link_to_db_cursor.fetchone() is None:
+        link_to_db_cursor.execute("ANALYZE")
 
 
 # ===================== Budget & Category Management ================
 # This section provides functions to:
 # - Validate date input to ensure proper formatting.
+# - Ask the user for an amount until a valid one is entered.
+# - Normalise names entered by the user.
+# - Convert amounts in pounds to pennies for storage.
 # - Check if a category exists in either the income or expense table.
 # - Set a budget for a specific income or expense category.
 # - Add a new category (income or expense) if it does not already exist.
 # - Display the budget set for a category.
 # - Calculate and display the remaining budget after income and expenses.
+@functools.lru_cache(maxsize=1024)
 def validate_date(date_text):
     """Checks if the given date is in the correct format (YYYY-MM-DD).
 
@@ -143,6 +624,12 @@ def validate_date(date_text):
     object.
     If it succeeds, the format is valid, and it returns True.
     If it fails (ValueError), it returns False, indicating an incorrect format.
+    Results are cached, so a date that was already checked is not parsed
+    again. Text that is not shaped like YYYY-MM-DD is turned away by the
+    precompiled _ISO_DATE pattern without raising an exception. Only dates
+    of the right shape are parsed, with date.fromisoformat, which is
+    much faster than strptime, to reject impossible days such as
+    2024-02-30.
 
     Args:
         date_text (str): Date entered by user.
@@ -151,45 +638,278 @@ def validate_date(date_text):
         bool: True if the correct date format is YYYY-MM-DD, otherwise False
         and will not be understood by the db.
     """
+    # Reject anything that is not shaped like YYYY-MM-DD straight away.
+    if not _ISO_DATE.fullmatch(date_text):
+        return False
+
     try:
-        datetime.strptime(date_text, "%Y-%m-%d")
+        date.fromisoformat(date_text)
         return True
     except ValueError:
         return False
 
 
+@functools.lru_cache(maxsize=256)
+def _to_day(date_text):
+    """Turns a YYYY-MM-DD date into a day number for storing in the db.
+
+    Goal dates are stored as INTEGER day numbers, so comparing two dates is
+    a plain number comparison. Results are cached like validate_date.
+
+    Args:
+        date_text (str): The date in YYYY-MM-DD format.
+
+    Returns:
+        int: The day number, where 0001-01-01 is day 1.
+
+    Raises:
+        ValueError: If the date is not a valid YYYY-MM-DD date.
+    """
+    return date.fromisoformat(date_text).toordinal()
+
+
+def _to_iso(day):
+    """Turns a day number stored in the db back into a YYYY-MM-DD date.
+
+    Args:
+        day (int): The day number, where 0001-01-01 is day 1.
+
+    Returns:
+        str: The date in YYYY-MM-DD format.
+    """
+    return date.fromordinal(day).isoformat()
+
+
+@functools.lru_cache(maxsize=256)
+def _norm(text):
+    """Normalises a name by removing extra spaces and converting it to
+    lowercase, for stable retrieval and data storage.
+
+    Names are normalised once where they enter the program, and the results
+    are cached because the same names are entered again and again.
+
+    Args:
+        text (str): The name to normalise.
+
+    Returns:
+        str: The normalised name.
+    """
+    return text.strip().lower()
+
+
+def _read_positive_float(prompt, amount_name="Amount"):
+    """Keeps asking the user for an amount until a valid number greater
+    than zero is entered.
+
+    Args:
+        prompt (str): The message shown when asking for the amount.
+        amount_name (str): What the amount is, used in the error message
+        (e.g. 'Expense amount').
+
+    Returns:
+        float: The amount entered by the user.
+    """
+    while True:
+        amount = _parse_amount(input(prompt))
+        if amount is None:
+            print("🚩 Invalid input! Please enter a numeric value.")
+            continue
+        # Prevent invalid entries of zero or less.
+        if amount <= 0:
+            print(f"🚩 {amount_name} must be greater than zero.")
+            continue  # Prompt user again if amount is invalid.
+        return amount
+
+
+def _parse_amount(text):
+    """Turns a typed-in amount into a number.
+
+    The text is checked against _POSITIVE_DECIMAL before float() is called,
+    so bad input is turned away without raising and catching a ValueError.
+
+    Args:
+        text (str): The amount as typed by the user.
+
+    Returns:
+        float: The amount, or None if the text is not a valid amount or is
+        more than MAX_AMOUNT.
+    """
+    text = text.strip()
+    if not _POSITIVE_DECIMAL.fullmatch(text):
+        return None
+
+    # Too many digits give inf, which is above MAX_AMOUNT as well.
+    amount = float(text)
+    if amount > MAX_AMOUNT:
+        return None
+    return amount
+
+
+def _to_pennies(amount):
+    """Converts an amount in pounds to whole pennies for storing in the db.
+
+    Amounts are stored as INTEGER pennies, which are exact and smaller on
+    disk than REAL pounds. Queries divide by 100.0 to show pounds again.
+
+    The amount is rounded as the decimal number the user typed, with halves
+    rounded up, so 1.005 becomes 101 pennies. Rounding the float itself
+    would give 100, because 1.005 is stored as slightly less than that.
+
+    Args:
+        amount (float): The amount in pounds.
+
+    Returns:
+        int: The amount in pennies.
+    """
+    # str() gives the shortest text for the float, i.e. what was typed.
+    pennies = Decimal(str(amount)) * 100
+    return int(pennies.quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+
+def _cached_query(key, sql, params=()):
+    """Runs a report query, reusing its rows until the db is written to.
+
+    The connection's total_changes count goes up with every INSERT, UPDATE
+    or DELETE, so a different count from the one stored with the cache
+    means the stored rows may be out of date and the cache is cleared.
+
+    Args:
+        key (tuple): Identifies the report and period, e.g.
+            ("summary", "monthly", "2024-05").
+        sql (str): The query to run on a cache miss.
+        params (tuple): Parameters for the query.
+
+    Returns:
+        list: The rows returned by the query.
+    """
+    link_to_db = link_to_finance_db()
+
+    if _SUMMARY_CACHE.get("total_changes") != link_to_db.total_changes:
+        _SUMMARY_CACHE.clear()
+        _SUMMARY_CACHE["total_changes"] = link_to_db.total_changes
+
+    if key not in _SUMMARY_CACHE:
+        _SUMMARY_CACHE[key] = link_to_db.execute(sql, params).fetchall()
+    return _SUMMARY_CACHE[key]
+
+
+def _report_progress():
+    """Progress handler installed on the connection while a report runs.
+
+    It never asks SQLite to stop by itself. Calling back into Python lets a
+    pending Ctrl+C be raised here, and SQLite then aborts the running query
+    with an "interrupted" OperationalError.
+
+    Returns:
+        int: 0, so the query carries on.
+    """
+    return 0
+
+
+def _run_report(report):
+    """Runs a report so that pressing Ctrl+C cancels it, not the whole app.
+
+    Args:
+        report (callable): The report function to run.
+    """
+    link_to_db = link_to_finance_db()
+    link_to_db.set_progress_handler(_report_progress, REPORT_PROGRESS_STEPS)
+
+    try:
+        report()
+
+    # Ctrl+C while a query is being stepped through.
+    except sqlite3.OperationalError as e:
+        if str(e) != "interrupted":
+            raise
+        print("\n🚩 Report cancelled. Returning to the main menu... 🔄\n")
+
+    # Ctrl+C while rows are being printed or a prompt is shown. Stop any
+    # query that is still open on the connection.
+    except KeyboardInterrupt:
+        link_to_db.interrupt()
+        print("\n🚩 Report cancelled. Returning to the main menu... 🔄\n")
+
+    finally:
+        link_to_db.set_progress_handler(None, 0)
+
+
+def _bulk_insert(sql, rows):
+    """Runs one INSERT statement for many rows, a chunk at a time.
+
+    Each chunk of BULK_INSERT_CHUNK_SIZE rows is inserted with executemany
+    inside one BEGIN IMMEDIATE ... COMMIT transaction. BEGIN IMMEDIATE takes
+    the write lock up front, so a chunk never fails halfway through because
+    the lock could not be upgraded, and the disk is synced once per chunk
+    instead of once per row.
+
+    Args:
+        sql (str): The INSERT statement, with ? placeholders.
+        rows (iterable): The parameters for each row. They are read lazily,
+        so a generator can be passed.
+
+    Raises:
+        sqlite3.Error: If the rows cannot be saved. The chunk that failed is
+        rolled back.
+    """
+    link_to_db = link_to_finance_db()
+    rows = iter(rows)
+
+    while True:
+        chunk = list(itertools.islice(rows, BULK_INSERT_CHUNK_SIZE))
+        if not chunk:
+            break
+        # The with block commits the chunk, or rolls it back on an error.
+        with link_to_db:
+            link_to_db.execute("BEGIN IMMEDIATE")
+            link_to_db.executemany(sql, chunk)
+
+
 def existing_category(category_name, category_type):
     """Checks if a category exists in either the income or expense category
     tables.
 
+    The answer is remembered, so asking about the same category again does
+    not query the db. The remembered answers are cleared whenever a new
+    category is added.
+
     Args:
-        category_name (str): The category name to check.
+        category_name (str): The category name to check, already normalised
+        with _norm() by the caller.
         category_type (str): Either 'income' or 'expense'. To understand which
         table to search.
 
     Returns:
         bool: True if the category exists, False otherwise.
     """
+    return _existing_category_cached(category_name, category_type)
+
+
+@functools.lru_cache(maxsize=256)
+def _existing_category_cached(category_name, category_type):
+    """Looks up a normalised category name in the db. Results are cached by
+    existing_category().
+
+    Args:
+        category_name (str): The normalised category name to check.
+        category_type (str): Either 'income' or 'expense'.
+
+    Returns:
+        bool: True if the category exists, False otherwise.
+    """
+    # Pick the lookup for the correct table. Unknown types have no table.
+    query = SQL_CATEGORY_EXISTS.get(category_type)
+    if query is None:
+        return False
+
     # Opens the db connection.
     link_to_db = link_to_finance_db()
     cursor = link_to_db.cursor()
 
-    # Function to normalise format by removing extra spaces and
-    # converts text to lowercase for stable retrieval and data storage.
-    category_name = category_name.strip().lower()
-
     # Inspect if category exists in the correct table.
-    if category_type == "income":
-        cursor.execute("SELECT 1 FROM income_categories WHERE "
-                       "LOWER(name_of_category) = ?", (category_name,))
-    else:
-        cursor.execute("SELECT 1 FROM expense_categories "
-                       "WHERE LOWER(name_of_category) = ?", (category_name,))
-
+    cursor.execute(query, (category_name,))
     category_found = cursor.fetchone()
 
-    # Close the db connection.
-    link_to_db.close()
     return category_found is not None
 
 
@@ -208,8 +928,8 @@ def set_budget_for_category(category_name, budget_value, category_type):
         ValueError: If category_type is not 'income' or 'expense'.
     """
     # Normalises user input.
-    category_name = category_name.strip().lower()
-    category_type = category_type.strip().lower()
+    category_name = _norm(category_name)
+    category_type = _norm(category_type)
 
     # Check and validate budget amount clearly added here.
     if budget_value <= 0:
@@ -235,23 +955,35 @@ def set_budget_for_category(category_name, budget_value, category_type):
             print("🚩 Budget not set. Returning to the main menu.")
             return
 
-    link_to_db = link_to_finance_db()
-    cursor = link_to_db.cursor()
-
     # User can set up or modify budget for a specify category.
-    cursor.execute('''INSERT OR REPLACE INTO budget_calculator
-                      (name_of_category, budget_value, type_of_category)
-                      VALUES (?, ?, ?)''',
-                   (category_name, budget_value, category_type))
+    set_budgets_bulk([(category_name, budget_value, category_type)])
 
-    # Save changes to the db connection.
-    link_to_db.commit()
     print(
         f"Budget of 💷 £{budget_value:.2f} set for '{category_name}' "
         f"({category_type}).")
     print("Returning to the main menu... 🔄\n")
 
-    link_to_db.close()
+
+def set_budgets_bulk(budgets):
+    """Sets the budgets of many categories at once.
+
+    All the budgets are written with executemany, in chunks of
+    BULK_INSERT_CHUNK_SIZE with one transaction each. A category that
+    already has a budget is changed in place by ON CONFLICT ... DO UPDATE,
+    rather than being deleted and added again as INSERT OR REPLACE does.
+
+    Args:
+        budgets (iterable): Tuples of (category_name, budget_value,
+        category_type). Names and types should already be normalised and
+        validated. Budgets are in pounds and are stored as pennies.
+
+    Raises:
+        sqlite3.Error: If the budgets cannot be saved. The chunk that failed
+        is rolled back.
+    """
+    _bulk_insert(SQL_UPSERT_BUDGET,
+                 ((category_name, _to_pennies(budget_value), category_type)
+                  for category_name, budget_value, category_type in budgets))
 
 
 def add_category(category_name, category_type):
@@ -265,22 +997,18 @@ def add_category(category_name, category_type):
         category_type (str): Tells user particularly if it is an'income' or
         'expense'.
     """
-    link_to_db = link_to_finance_db()
-    cursor = link_to_db.cursor()
-
     # Insert the category into the correct table.
-    if category_type == "income":
-        cursor.execute("INSERT INTO income_categories (name_of_category) "
-                       "VALUES (?)", (category_name,))
-    else:
-        cursor.execute("INSERT INTO expense_categories (name_of_category) "
-                       "VALUES (?)", (category_name,))
-
-    link_to_db.commit()
+    # The with block saves the change, or undoes it if an error occurs.
+    # The RETURNING row is read so the statement finishes before the commit.
+    with link_to_finance_db() as link_to_db:
+        link_to_db.execute("BEGIN IMMEDIATE")
+        link_to_db.execute(SQL_INSERT_CATEGORY[category_type],
+                           (category_name, None)).fetchall()
+
+    # Forget cached category lookups so the new category is found.
+    _existing_category_cached.cache_clear()
     print(f"Category '{category_name}' ({category_type}) added successfully!")
 
-    link_to_db.close()
-
 
 def display_category_budget(category_name, category_type):
     """Fetches and displays the budget set for a specific category (income or
@@ -294,8 +1022,8 @@ def display_category_budget(category_name, category_type):
         'expense'.
 
     """
-    category_name = category_name.strip().lower()
-    category_type = category_type.strip().lower()
+    category_name = _norm(category_name)
+    category_type = _norm(category_type)
 
     # Confirms to the user whether the catgeory exists or not.
     # If the category doesn't exist, it alerts them to add it before.
@@ -308,9 +1036,10 @@ def display_category_budget(category_name, category_type):
     cursor = link_to_db.cursor()
 
     # Fetch the budget for particular category.
-    cursor.execute('''SELECT budget_value FROM budget_calculator
-                      WHERE LOWER(TRIM(name_of_category)) = ?
-                      AND LOWER(TRIM(type_of_category)) = ?''',
+    cursor.execute('''SELECT budget_value_pennies / 100.0
+                      FROM budget_calculator
+                      WHERE name_of_category = ?
+                      AND type_of_category = ?''',
                    (category_name, category_type))
 
     result = cursor.fetchone()
@@ -323,8 +1052,6 @@ def display_category_budget(category_name, category_type):
         print(f"No budget set for '{category_name}' ({category_type}). "
               "Set one first.")
 
-    link_to_db.close()
-
 
 def magical_budget_calculator():
     """
@@ -339,19 +1066,17 @@ def magical_budget_calculator():
     link_to_db = link_to_finance_db()
     cursor = link_to_db.cursor()
 
-    # Fetch the user's total income.
+    # Fetch the user's total income and total expenses in one query.
+    # Both are kept up to date in the totals table by triggers, so there is
+    # no need to add up every record. If a total is missing, it is set to 0.
+    # Totals are stored in pennies and converted to pounds here.
     cursor.execute(
-        "SELECT SUM(sum_of_income) FROM users_incomes"
+        "SELECT (SELECT COALESCE(SUM(value), 0) / 100.0 FROM totals "
+        "WHERE kind = 'income'), "
+        "(SELECT COALESCE(SUM(value), 0) / 100.0 FROM totals "
+        "WHERE kind = 'expense')"
     )
-    # If there is no income, set the value to 0.
-    total_income = cursor.fetchone()[0] or 0
-
-    # Fetch the user’s total expenses.
-    cursor.execute(
-        "SELECT SUM(amount_spent) FROM users_expenses"
-    )
-    # If there is no income, set the value to 0.
-    total_expenses = cursor.fetchone()[0] or 0
+    total_income, total_expenses = cursor.fetchone()
 
     # Calculate the remaining budget (income - expenses) for the user.
     remaining_budget = total_income - total_expenses
@@ -364,8 +1089,6 @@ def magical_budget_calculator():
 
     print("Returning to the main menu... 🔄\n")
 
-    link_to_db.close()
-
 
 # =========================== Expense Management ===========================
 # This section provides functions to:
@@ -399,8 +1122,7 @@ def record_new_spending():
             break
         print("🚩 Invalid date format! Please enter in YYYY-MM-DD format.")
 
-    type_of_spending = input("Enter the category of expense 🛒: "
-                             ).strip().lower()
+    type_of_spending = _norm(input("Enter the category of expense 🛒: "))
 
     # Ensure category exists or request user to add it.
     # If user inputs N, display message and return to the main menu.
@@ -410,9 +1132,7 @@ def record_new_spending():
                         f"expense category? (Y/N): ").strip().lower()
 
         if add_new == "y":
-            add_expense_category(type_of_spending)
-
-            if not existing_category(type_of_spending, "expense"):
+            if not add_expense_category(type_of_spending):
                 print("🚩 Category not added — possibly due to a duplicate or "
                       "invalid name.\n"
                       "Please try adding the expense again with a valid new "
@@ -425,33 +1145,13 @@ def record_new_spending():
 
     # Check that the amount spent is a valid numeric value and greater than
     # zero.
-    while True:
-        try:
-            amount_spent = float(input("How much did you spend? 🛍️: ").strip())
-            # Added validation to ensure the entered expense amount is greater
-            # than zero to prevent invalid entries.
-            if amount_spent <= 0:
-                print("🚩 Expense amount must be greater than zero.")
-                continue  # Prompt user again if amount is invalid.
-            break
-        except ValueError:
-            print("🚩 Invalid input! Please enter a numeric value.")
+    amount_spent = _read_positive_float("How much did you spend? 🛍️: ",
+                                        "Expense amount")
 
     # Put the expense record into the db.
     try:
-        with sqlite3.connect("Spend_Wise_Buddy.db") as link_to_db:
-            cursor = link_to_db.cursor()
-
-            # Insert a new expense record into the 'users_expenses' table.
-            cursor.execute(
-                "INSERT INTO users_expenses (date_of_spending, "
-                "type_of_spending, "
-                "amount_spent) VALUES (?, ?, ?)",
-                (date_of_spending, type_of_spending, amount_spent)
-            )
-
-            # Commit the transaction to save changes to the database
-            link_to_db.commit()
+        record_spendings_bulk([(date_of_spending, type_of_spending,
+                                amount_spent)])
 
     # Handle any database-related errors.
     except sqlite3.Error as e:
@@ -462,6 +1162,114 @@ def record_new_spending():
     print("Returning to the main menu... 🔄\n")
 
 
+def record_many_spendings():
+    """
+    Lets the user paste many expenses at once, one per line, in the form
+    YYYY-MM-DD,category,amount. Reading stops at the first blank line.
+
+    1. Lines with a bad date or amount are reported and left out.
+    2. Categories that don't exist yet are listed, and the user is asked
+    once whether to add them all.
+    3. All the valid expenses are saved in a single transaction with
+    record_spendings_bulk, instead of one commit per expense.
+
+    Returns:
+        None
+    """
+
+    print("Enter one expense per line as YYYY-MM-DD,category,amount 🧾")
+    print("Leave a blank line when you are done.")
+
+    rows = []
+    line_number = 0
+    while True:
+        line = input().strip()
+        if not line:
+            break
+        line_number += 1
+
+        if line.count(",") < 2:
+            print(f"🚩 Line {line_number}: expected date,category,amount, "
+                  f"skipped.")
+            continue
+
+        # The date and amount can't contain commas, so the category is
+        # whatever sits between the first and the last comma.
+        date_of_spending, _, rest = line.partition(",")
+        type_of_spending, _, amount_text = rest.rpartition(",")
+        date_of_spending = date_of_spending.strip()
+        type_of_spending = _norm(type_of_spending)
+        amount_spent = _parse_amount(amount_text)
+
+        if not validate_date(date_of_spending):
+            print(f"🚩 Line {line_number}: invalid date, skipped.")
+        elif not type_of_spending:
+            print(f"🚩 Line {line_number}: missing category, skipped.")
+        elif amount_spent is None:
+            print(f"🚩 Line {line_number}: invalid amount, skipped.")
+        elif amount_spent <= 0:
+            print(f"🚩 Line {line_number}: expense amount must be greater "
+                  f"than zero, skipped.")
+        else:
+            rows.append((date_of_spending, type_of_spending, amount_spent))
+
+    if not rows:
+        print("🚩 No valid expenses to record. Returning to the main menu.")
+        return
+
+    # Ask once about all the missing categories rather than per line.
+    missing = sorted({type_of_spending for _, type_of_spending, _ in rows
+                      if not existing_category(type_of_spending, "expense")})
+    if missing:
+        print(f"🚩 These expense categories don't exist: "
+              f"{', '.join(missing)}")
+        add_new = input("Would you like to add them as new expense "
+                        "categories? (Y/N): ").strip().lower()
+        if add_new != "y":
+            print("🚩 Expenses not recorded. Returning to the main menu.")
+            return
+        for category_name in missing:
+            if not add_expense_category(category_name):
+                print("🚩 Expenses not recorded. Returning to the main "
+                      "menu.")
+                return
+
+    # Put all the expense records into the db in one go.
+    try:
+        record_spendings_bulk(rows)
+
+    # Handle any database-related errors.
+    except sqlite3.Error as e:
+        print(f"🚩 Database error occurred while saving expenses: {e}")
+        return
+
+    print(f"{len(rows)} expense(s) have been successfully recorded! ✅")
+    print("Returning to the main menu... 🔄\n")
+
+
+def record_spendings_bulk(rows):
+    """Saves many expense records into the database at once.
+
+    The rows are inserted with executemany in chunks of
+    BULK_INSERT_CHUNK_SIZE, and each chunk is saved in one transaction.
+    This is much faster than saving the records one by one, e.g. when
+    importing expenses from a file.
+
+    Args:
+        rows (iterable): Tuples of (date_of_spending, type_of_spending,
+        amount_spent) to save. Amounts are in pounds and are stored as
+        pennies. A generator, e.g. over the lines of a file, is read one
+        chunk at a time, so the whole file is never held in memory.
+
+    Raises:
+        sqlite3.Error: If the records cannot be saved. The chunk that failed
+        is rolled back.
+    """
+    _bulk_insert(SQL_INSERT_EXPENSE,
+                 ((date_of_spending, type_of_spending, _to_pennies(amount))
+                  for date_of_spending, type_of_spending, amount in rows))
+
+
 def add_expense_category(category_name):
     """Adds a new expense category if it does not already exist.
 
@@ -469,36 +1277,34 @@ def add_expense_category(category_name):
         category_name (str): The name of the expense category.
 
     Returns:
-        None
+        bool: True if the category was added, False otherwise.
     """
 
-    category_name = category_name.strip().lower()
+    category_name = _norm(category_name)
 
     # Check if empty.
     if not category_name:
         print("🚩 Category name cannot be empty!")
-        return
+        return False
 
-    with sqlite3.connect("Spend_Wise_Buddy.db") as link_to_db:
+    # The with block saves the change, or undoes it if an error occurs.
+    with link_to_finance_db() as link_to_db:
         cursor = link_to_db.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
 
-        # Check if category already exists. (case-insensitive)
-        cursor.execute("SELECT 1 FROM expense_categories WHERE "
-                       "LOWER(name_of_category) = ?",
-                       (category_name,))
-        existing_category = cursor.fetchone()
+        # Put the new category into the db. If it already exists
+        # (case-insensitive), nothing is inserted and no row is returned.
+        cursor.execute(SQL_INSERT_CATEGORY["expense"], (category_name, None))
+        category_added = cursor.fetchone()
 
-        if existing_category:
+        if not category_added:
             print(f"🚩 Category '{category_name}' already exists!")
-            return
+            return False
 
-        # Put the new category into the db.
-        cursor.execute("INSERT INTO expense_categories (name_of_category) "
-                       "VALUES (?)",
-                       (category_name,))
-        link_to_db.commit()
+        _existing_category_cached.cache_clear()
 
         print(f"Category '{category_name}' has been successfully added. ✅ ")
+        return True
 
 
 def check_expenses():
@@ -514,7 +1320,7 @@ def check_expenses():
     """
 
     # Set up connection to the db.
-    with sqlite3.connect("Spend_Wise_Buddy.db") as link_to_db:
+    with link_to_finance_db() as link_to_db:
         link_to_db_cursor = link_to_db.cursor()
 
         # Giving the user options on ways of view their expenses.
@@ -529,22 +1335,21 @@ def check_expenses():
         # Based on the user's input, run the relevant SQL query.
         if choice == "1":
             # If the user chooses option 1, display all expenses from the db.
-            link_to_db_cursor.execute("SELECT * FROM users_expenses")
+            link_to_db_cursor.execute(SQL_SELECT_EXPENSES)
 
         elif choice == "2":
             # If the user picks option 2,
             # ask which type of expense to filter by.
-            type_of_spending = input("Please enter the type of expense 🛒: "
-                                     ).strip().lower()
+            type_of_spending = _norm(input("Please enter the type of "
+                                           "expense 🛒: "))
             if not type_of_spending:
                 print("🚩 Expense type cannot be empty. Please try again!")
                 return
 
             # Only retrieve expenses that match the type entered.
             link_to_db_cursor.execute(
-                "SELECT * FROM users_expenses WHERE LOWER(TRIM"
-                "(type_of_spending)) = ?",
-                # Ensuring proper matching regardless of case or spaces.
+                SQL_SELECT_EXPENSES_BY_TYPE,
+                # The column's NOCASE collation matches regardless of case.
                 (type_of_spending,)
             )
 
@@ -559,28 +1364,28 @@ def check_expenses():
                       "format.")
                 return
             # Show only the expenses from that date to the user.
-            link_to_db_cursor.execute(
-                "SELECT * FROM users_expenses WHERE date_of_spending = ?",
-                (date_of_spending,)
-            )
+            link_to_db_cursor.execute(SQL_SELECT_EXPENSES_BY_DATE,
+                                      (date_of_spending,))
 
         else:
             # Show an error message, if the user enters an invalid option.
             print("Oops! 🚩 Option not available. Please pick 1, 2, or 3.")
             return
 
-        # Accumulate and store the query results from the db.
-        users_expenses = link_to_db_cursor.fetchall()
+        # Present all expenses to the user. Rows are read from the cursor
+        # one at a time, so the full result never has to be held in memory.
+        expenses_found = False
+        for exp in link_to_db_cursor:
+            if not expenses_found:
+                print("\nHave a look at all your recorded expenses 📝:")
+                print("-" * 50)
+                expenses_found = True
 
-        # Present all expenses to the user.
-        if users_expenses:
-            print("\nHave a look at all your recorded expenses 📝:")
-            print("-" * 50)
-            for exp in users_expenses:
-                # Print each expense in an easy-to-read format.
-                print(f"🆔 ID: {exp[0]}, 🗓️ Date: {exp[1]}, "
-                      f"🛒 Type: {exp[2]}, 💵 Amount: £{exp[3]:.2f}")
+            # Print each expense in an easy-to-read format.
+            print(f"🆔 ID: {exp[0]}, 🗓️ Date: {exp[1]}, "
+                  f"🛒 Type: {exp[2]}, 💵 Amount: £{exp[3]:.2f}")
 
+        if expenses_found:
             print("Returning to the main menu... 🔄\n")
 
         else:
@@ -605,39 +1410,33 @@ def update_my_spending():
 
     expense_ID_No = input("Enter the expense ID number to update: ").strip()
 
-    if not expense_ID_No.isdigit():
+    if not expense_ID_No.isdecimal():
         print("🚩 Invalid input! Expense ID must be a number.")
         return
 
-    link_to_db_cursor.execute(
-        "SELECT * FROM users_expenses WHERE id = ?",
-        (expense_ID_No,)
-    )
+    link_to_db_cursor.execute(SQL_SELECT_EXPENSE_BY_ID, (expense_ID_No,))
     user_expenses = link_to_db_cursor.fetchone()
 
     if user_expenses:
         print(f"🆔 ID: {user_expenses[0]}, 🗓️ Date: {user_expenses[1]}, "
               f"🛒 Type: {user_expenses[2]}, 💵 Amount: £{user_expenses[3]:.2f}")
 
-        while True:
-            try:
-                new_spending_amount = float(input("Enter the new amount of "
-                                                  "spending 💵: ").strip())
-                break
-            except ValueError:
-                print("🚩 Invalid input! Please enter a valid numeric amount.")
+        new_spending_amount = _read_positive_float("Enter the new amount of "
+                                                   "spending 💵: ",
+                                                   "Expense amount")
 
-        link_to_db_cursor.execute(
-            "UPDATE users_expenses SET amount_spent = ? WHERE id = ?",
-            (new_spending_amount, expense_ID_No)
-        )
-        link_to_db.commit()
+        # The with block saves the change, or undoes it if an error occurs.
+        with link_to_db:
+            link_to_db_cursor.execute("BEGIN IMMEDIATE")
+            link_to_db_cursor.execute(
+                SQL_UPDATE_EXPENSE_AMOUNT,
+                (_to_pennies(new_spending_amount), expense_ID_No)
+            )
         print("Expense changed successfully! 😇 ✅")
     else:
         print("Invalid expense ID, please try again. 😔")
 
     print("Returning to the main menu... 🔄\n")
-    link_to_db.close()
 
 
 def delete_spending_type():
@@ -656,31 +1455,28 @@ def delete_spending_type():
     link_to_db = link_to_finance_db()
     link_to_db_cursor = link_to_db.cursor()
 
-    category_to_delete = input("What type of expense do you want to delete? "
-                               ).strip().lower()
+    category_to_delete = _norm(input("What type of expense do you want to "
+                                     "delete? "))
 
     if not category_to_delete:
         print("🚩 Expense type cannot be empty! Please enter a valid type.")
-        link_to_db.close()
         return
 
-    link_to_db_cursor.execute(
-        "SELECT * FROM users_expenses WHERE LOWER(TRIM(type_of_spending)) = ?",
-        (category_to_delete,)
-    )
-    expense_found = link_to_db_cursor.fetchall()
+    # Only check whether a matching expense exists. SQLite stops at the
+    # first match instead of reading every row.
+    link_to_db_cursor.execute(SQL_EXPENSE_TYPE_EXISTS,
+                              (category_to_delete,))
+    expense_found = link_to_db_cursor.fetchone()[0]
 
     if expense_found:
         confirm = input(
             f"Are you sure you want to delete all expenses under "
             f"'{category_to_delete}'? (Y/N): ").strip().lower()
         if confirm == "y":
-            link_to_db_cursor.execute(
-                "DELETE FROM users_expenses WHERE LOWER(TRIM(type_of_spending"
-                ")) = ?",
-                (category_to_delete,)
-            )
-            link_to_db.commit()
+            with link_to_db:
+                link_to_db_cursor.execute("BEGIN IMMEDIATE")
+                link_to_db_cursor.execute(SQL_DELETE_EXPENSE_TYPE,
+                                          (category_to_delete,))
             print(f"All expenses under '{category_to_delete}' are deleted! ✅")
         else:
             print("Deleting the expense has now been cancelled.")
@@ -688,7 +1484,6 @@ def delete_spending_type():
         print(f"No expenses found under '{category_to_delete}'.")
 
     print("Returning to the main menu... 🔄\n")
-    link_to_db.close()
 
 
 # =========================== Income Management ===========================
@@ -724,8 +1519,7 @@ def record_an_income():
             break
         print("🚩 Invalid date format! Please enter in YYYY-MM-DD format.")
 
-    source_of_income = input("What is the source of income? 💼: "
-                             ).strip().lower()
+    source_of_income = _norm(input("What is the source of income? 💼: "))
 
     # Check if the category exists, otherwise ask user to add it.
     if not existing_category(source_of_income, "income"):
@@ -734,41 +1528,48 @@ def record_an_income():
                         "income category? (Y/N): ").strip().lower()
 
         if add_new == "y":
-            add_income_category(source_of_income)
+            if not add_income_category(source_of_income):
+                print("🚩 Category not added — possibly due to a duplicate or "
+                      "invalid name.\n"
+                      "Please try adding the income again with a valid new "
+                      "category.")
+                return
         else:
             print("🚩 Income not recorded. Returning to the main menu.")
             return
 
     # Check that the amount of income is valid numeric value and greater than
     # zero.
-    while True:
-        try:
-            sum_of_income = float(input("Please input the income amount 💰: "
-                                        ).strip())
-            # ✅ Added validation to ensure the entered income amount is
-            # greater than zero to avoid invalid entries.
-            if sum_of_income <= 0:
-                print("🚩 Income amount must be greater than zero.")
-                continue  # Prompt user again if amount is invalid.
-            break
-        except ValueError:
-            print("🚩 Invalid input! Please enter a numeric value.")
+    sum_of_income = _read_positive_float("Please input the income amount 💰: ",
+                                         "Income amount")
 
     # Put income record into the db.
-    with sqlite3.connect("Spend_Wise_Buddy.db") as link_to_db:
-        cursor = link_to_db.cursor()
-        cursor.execute(
-            '''INSERT INTO users_incomes
-            (source_of_income, sum_of_income, date_of_income)
-            VALUES (?, ?, ?)''',
-            (source_of_income, sum_of_income, date_of_income)
-        )
-        link_to_db.commit()
+    record_incomes_bulk([(source_of_income, sum_of_income, date_of_income)])
 
     print(f"✅ Income from '{source_of_income}' recorded successfully!")
     print("Returning to the main menu... 🔄\n")
 
 
+def record_incomes_bulk(rows):
+    """Saves many income records into the database at once.
+
+    The rows are inserted with executemany in chunks of
+    BULK_INSERT_CHUNK_SIZE, and each chunk is saved in one transaction.
+
+    Args:
+        rows (iterable): Tuples of (source_of_income, sum_of_income,
+        date_of_income) to save. Amounts are in pounds and are stored as
+        pennies. A generator is read one chunk at a time.
+
+    Raises:
+        sqlite3.Error: If the records cannot be saved. The chunk that failed
+        is rolled back.
+    """
+    _bulk_insert(SQL_INSERT_INCOME,
+                 ((source_of_income, _to_pennies(amount), date_of_income)
+                  for source_of_income, amount, date_of_income in rows))
+
+
 def add_income_category(category_name=None):
     """Allows the user to add a new income category to the database.
     If it doesn't exist already.
@@ -778,47 +1579,42 @@ def add_income_category(category_name=None):
         If not given, the user is asked to enter one.
 
     Returns:
-        None
+        bool: True if the category was added, False otherwise.
     """
 
     if not category_name:
         category_name = input("Enter the new income category (e.g., Salary): "
-                              ).strip()
+                              )
 
-    category_name = category_name.strip().lower()
+    category_name = _norm(category_name)
 
     # Do not allow black input.
     if not category_name:
         print("🚩 Income category name cannot be empty!")
-        return
+        return False
 
     description = input("Enter a description for this category (optional): "
                         ).strip()
 
-    with sqlite3.connect("Spend_Wise_Buddy.db") as link_to_db:
+    # The with block saves the change, or undoes it if an error occurs.
+    with link_to_finance_db() as link_to_db:
         cursor = link_to_db.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
 
-        # Check if the category already exists.
-        cursor.execute(
-            "SELECT 1 FROM income_categories "
-            "WHERE LOWER(name_of_category) = ?",
-            (category_name,)
-        )
-        existing_category = cursor.fetchone()
+        # Put the new income category into the db. If it already exists,
+        # nothing is inserted and no row is returned.
+        cursor.execute(SQL_INSERT_CATEGORY["income"],
+                       (category_name, description))
+        category_added = cursor.fetchone()
 
-        if existing_category:
+        if not category_added:
             print(f"🚩 Income category '{category_name}' already exists!")
-            return
+            return False
 
-        # Put the new income category into the db.
-        cursor.execute(
-            "INSERT INTO income_categories (name_of_category, description) "
-            "VALUES (?, ?)",
-            (category_name, description)
-        )
-        link_to_db.commit()
+        _existing_category_cached.cache_clear()
 
     print(f"✅ Income category '{category_name}' added successfully!")
+    return True
 
 
 def check_income():
@@ -837,7 +1633,7 @@ def check_income():
     Returns:
         None
     """
-    link_to_db = sqlite3.connect("Spend_Wise_Buddy.db")
+    link_to_db = link_to_finance_db()
     link_to_db_cursor = link_to_db.cursor()
 
     # Display the user how they want to view income.
@@ -849,40 +1645,36 @@ def check_income():
 
     if choice == "1":
         # Gather all income records.
-        link_to_db_cursor.execute("SELECT * FROM users_incomes")
+        link_to_db_cursor.execute(SQL_SELECT_INCOMES)
     elif choice == "2":
         # Ask the user to specify the income type.
-        income_source = input("Enter the income source: ").strip().lower()
-        link_to_db_cursor.execute(
-            "SELECT * FROM users_incomes WHERE LOWER(source_of_income) = ?",
-            (income_source,)
-        )
+        income_source = _norm(input("Enter the income source: "))
+        link_to_db_cursor.execute(SQL_SELECT_INCOMES_BY_SOURCE,
+                                  (income_source,))
     else:
         print("🚩 Option unavailable. Please select out of 1 or 2. ")
-        link_to_db.close()
         return
 
-    # Fetch all matching records.
-    user_income = link_to_db_cursor.fetchall()
+    # Fetch the first batch of matching records.
+    user_income = link_to_db_cursor.fetchmany(DISPLAY_BATCH_SIZE)
 
     # Show user income records if they are found.
     if user_income:
         print("\nYour Personal Income Records: 📄")
         print("-" * 50)
 
-        for inc in user_income:
-            print(f"🆔 ID: {inc[0]}, "
-                  f"🗓️ Date: {inc[3]}, "
-                  f"📌 Source: {inc[1]}, "
-                  f"💰 Amount: £{inc[2]:.2f}")
-            # Add space to make it easier to read.
-            print()
+        # Build the lines of a batch of records and write them at once, then
+        # fetch the next batch. Each record is followed by a blank line to
+        # make it easier to read.
+        while user_income:
+            sys.stdout.write("".join(
+                INCOME_RECORD_FORMAT.format(*inc) for inc in user_income
+            ))
+            user_income = link_to_db_cursor.fetchmany(DISPLAY_BATCH_SIZE)
     else:
         print("🚩 No income records found matching your criteria.")
 
     print("Returning to the main menu... 🔄\n")
-    # Close the db connection.
-    link_to_db.close()
 
 
 # Function to modify the user’s income.
@@ -900,7 +1692,7 @@ def update_my_income():
     Returns:
         None
     """
-    link_to_db = sqlite3.connect("Spend_Wise_Buddy.db")
+    link_to_db = link_to_finance_db()
     link_to_db_cursor = link_to_db.cursor()
 
     # Ask user for the ID of the income record to update.
@@ -908,16 +1700,14 @@ def update_my_income():
         "Enter the income ID number you want to update: "
     ).strip()
 
-    if not income_ID_str.isdigit() or int(income_ID_str) <= 0:
+    if not income_ID_str.isdecimal() or int(income_ID_str) <= 0:
         print("🚩 Invalid ID! Please enter a valid positive numeric income ID.")
-        link_to_db.close()
         return
 
     income_ID_No = int(income_ID_str)
 
     # Find the current income record.
-    link_to_db_cursor.execute(
-        "SELECT * FROM users_incomes WHERE id = ?", (income_ID_No,))
+    link_to_db_cursor.execute(SQL_SELECT_INCOME_BY_ID, (income_ID_No,))
     user_income = link_to_db_cursor.fetchone()
 
     # Only update if the user’s income ID exists.
@@ -928,25 +1718,12 @@ def update_my_income():
         print(f"📌 Source: {user_income[1]}")
         print(f"💰 Amount: £{user_income[2]:.2f}")
 
-        while True:
-            try:
-                new_income_amount = float(input("Enter the new "
-                                                "income amount 💰: "))
-                if new_income_amount <= 0:
-                    print("🚩 Income amount must be greater than **£0**. "
-                          "Please try again.")
-                    continue
-                break
-            except ValueError:
-                print("🚩 Invalid input! Please enter a "
-                      "**valid** numeric value.")
+        new_income_amount = _read_positive_float("Enter the new "
+                                                 "income amount 💰: ",
+                                                 "Income amount")
 
         # Modify the db record.
-        link_to_db_cursor.execute(
-            "UPDATE users_incomes SET sum_of_income = ? WHERE id = ?",
-            (new_income_amount, income_ID_No)
-        )
-        link_to_db.commit()
+        bulk_update_incomes([(income_ID_No, new_income_amount)])
 
         print("New income record updated successfully! ✅")
     else:
@@ -954,7 +1731,69 @@ def update_my_income():
 
     print("Returning to the main menu... 🔄\n")
 
-    link_to_db.close()
+
+@functools.lru_cache(maxsize=32)
+def _sql_bulk_update_incomes(count):
+    """Builds the UPDATE used by bulk_update_incomes for a number of records.
+
+    The text is built once per number of records, so repeated chunks of the
+    same size send sqlite3 the same statement and reuse its prepared copy.
+
+    Args:
+        count (int): How many records the statement changes.
+
+    Returns:
+        str: The UPDATE statement, with three ? placeholders per record.
+    """
+    return ("UPDATE users_incomes SET sum_of_income_pennies = CASE id"
+            + " WHEN ? THEN ?" * count
+            + " ELSE sum_of_income_pennies END "
+            "WHERE id IN (" + ", ".join("?" * count) + ")")
+
+
+def bulk_update_incomes(updates):
+    """Changes the amounts of many income records at once.
+
+    Each chunk of BULK_UPDATE_CHUNK_SIZE records is changed by a single
+    UPDATE with a CASE expression that picks the new amount for each ID,
+    and saved in one transaction, instead of one UPDATE and commit for
+    every record.
+
+    Args:
+        updates (iterable): Tuples of (income_id, new_amount), with
+        amounts in pounds. They are stored as pennies. A generator is read
+        one chunk at a time.
+
+    Returns:
+        int: The number of income records that were changed.
+
+    Raises:
+        sqlite3.Error: If the records cannot be changed. The chunk that
+        failed is rolled back.
+    """
+    link_to_db = link_to_finance_db()
+    records_changed = 0
+    updates = iter(updates)
+
+    while True:
+        chunk = list(itertools.islice(updates, BULK_UPDATE_CHUNK_SIZE))
+        if not chunk:
+            break
+
+        # Bind (id, pennies) for every WHEN, then every id for the IN list.
+        params = []
+        for income_id, new_amount in chunk:
+            params += [income_id, _to_pennies(new_amount)]
+        params += [income_id for income_id, _ in chunk]
+
+        # The with block commits the chunk, or rolls it back on an error.
+        with link_to_db:
+            link_to_db.execute("BEGIN IMMEDIATE")
+            cursor = link_to_db.execute(_sql_bulk_update_incomes(len(chunk)),
+                                        params)
+        records_changed += cursor.rowcount
+
+    return records_changed
 
 
 def delete_income_type():
@@ -970,41 +1809,34 @@ def delete_income_type():
     Returns:
         None
     """
-    link_to_db = sqlite3.connect("Spend_Wise_Buddy.db")
+    link_to_db = link_to_finance_db()
     link_to_db_cursor = link_to_db.cursor()
 
-    category_to_delete = input("Enter the income type to delete: "
-                               ).strip().lower()
+    category_to_delete = _norm(input("Enter the income type to delete: "))
 
-    # Use case-insensitive matching and trim spaces to improve accuracy.
-    link_to_db_cursor.execute(
-        "SELECT * FROM users_incomes WHERE LOWER(TRIM(source_of_income)) = ?",
-        # Ensuring proper matching regardless of case or extra spaces.
-        (category_to_delete,)
-    )
-    user_income = link_to_db_cursor.fetchall()
+    # The column's NOCASE collation gives case-insensitive matching.
+    link_to_db_cursor.execute(SQL_INCOME_SOURCE_EXISTS,
+                              (category_to_delete,))
+    user_income = link_to_db_cursor.fetchone()[0]
 
     if user_income:
         confirm = input(f"Delete '{category_to_delete}'? Enter (Y/N): "
                         ).strip().lower()
 
         if confirm == "y":
-            link_to_db_cursor.execute(
-                "DELETE FROM users_incomes WHERE LOWER(TRIM(source_of_income))"
-                "= ?",
-                # Ensuring proper deletion regardless of case or spaces
-                (category_to_delete,)
-            )
-            link_to_db.commit()
-            print(f"Income records under '{category_to_delete}' are deleted. ✅"
-                  )
+            with link_to_db:
+                link_to_db_cursor.execute("BEGIN IMMEDIATE")
+                link_to_db_cursor.execute(SQL_DELETE_INCOME_SOURCE,
+                                          (category_to_delete,))
+            # rowcount tells how many records the DELETE removed.
+            print(f"{link_to_db_cursor.rowcount} income record(s) under "
+                  f"'{category_to_delete}' are deleted. ✅")
         else:
             print("Deleting for this income type has now been cancelled. 🚩")
     else:
         print(f"No income records found under '{category_to_delete}'. 🚩")
 
     print("Returning to the main menu... 🔄\n")
-    link_to_db.close()
 
 
 # ===================== Income & Expense Tracker =====================
@@ -1031,44 +1863,20 @@ def income_expenses_summary():
     while True:
         timeframe = input("Do you want a monthly or annual summary? "
                           "(monthly/annually): ").strip().lower()
-        if timeframe in ["monthly", "annually"]:
+        if timeframe in SQL_SUMMARY:
             break
         print("🚩 Invalid option! Please choose 'monthly' or 'annually'.")
 
-    # Gather the current date and time.
-    selected_datetime = datetime.now()
+    # Setting the current period to filter by according to the user's
+    # choice, e.g. "2024-05" for monthly or "2024" for annually.
+    date_format, sql = SQL_SUMMARY[timeframe]
+    formatted_date = datetime.now().strftime(date_format)
 
-    # Setting SQL filters according to the user's choice.
-    if timeframe == "monthly":
-        formatted_date = selected_datetime.strftime("%Y-%m")
-        date_filter = "strftime('%Y-%m', date_of_spending) = ?"
-        income_filter = "strftime('%Y-%m', date_of_income) = ?"
-    else:
-        formatted_date = selected_datetime.strftime("%Y")
-        date_filter = "strftime('%Y', date_of_spending) = ?"
-        income_filter = "strftime('%Y', date_of_income) = ?"
-
-    # Establish a connection to the database.
-    with sqlite3.connect("Spend_Wise_Buddy.db") as link_to_db:
-        cursor = link_to_db.cursor()
-
-        # Retrieve total expenses for the selected period.
-        cursor.execute(
-            f"SELECT SUM(amount_spent) FROM users_expenses "
-            f"WHERE {date_filter}",
-            (formatted_date,)
-        )
-
-        total_amount_of_expenses = cursor.fetchone()[0] or 0
-
-        # Retrieve total income for the selected period.
-        cursor.execute(
-            f"SELECT SUM(sum_of_income) FROM users_incomes "
-            f"WHERE {income_filter}",
-            (formatted_date,)
-        )
-
-        total_amount_of_income = cursor.fetchone()[0] or 0
+    # Retrieve total expenses and total income for the selected period in
+    # one query, or reuse the last result if nothing has changed since.
+    summary_rows = _cached_query(("summary", timeframe, formatted_date), sql,
+                                 (formatted_date, formatted_date))
+    total_amount_of_expenses, total_amount_of_income = summary_rows[0]
 
     # Calculate the remaining balance.
     remaining_balance = total_amount_of_income - total_amount_of_expenses
@@ -1098,26 +1906,37 @@ def type_of_spending_and_income():
     link_to_db = link_to_finance_db()
     cursor = link_to_db.cursor()
 
-    # Show the user a breakdown of their expenses by type.
-    print("\nBreakdown of your expenses by type 🛍️:")
+    # Fetch the breakdown of expenses and incomes by type in one query.
+    # The first column tells which kind each row is; expenses come first.
     cursor.execute(
-        "SELECT type_of_spending, SUM(amount_spent) "
-        "FROM users_expenses GROUP BY type_of_spending"
+        "SELECT 'expense' AS kind, type_of_spending AS label, "
+        "SUM(amount_spent_pennies) / 100.0 "
+        "FROM users_expenses GROUP BY type_of_spending "
+        "UNION ALL "
+        "SELECT 'income', source_of_income, "
+        "SUM(sum_of_income_pennies) / 100.0 "
+        "FROM users_incomes GROUP BY source_of_income "
+        "ORDER BY kind, label"
     )
-    for type, total in cursor.fetchall():
-        print(f"Type: {type}, Total: £{total:.2f}")
 
-    # Show the user a breakdown of their incomes by type.
-    print("\nBreakdown of your incomes by type 💼:")
-    cursor.execute(
-        "SELECT source_of_income, SUM(sum_of_income) "
-        "FROM users_incomes GROUP BY source_of_income"
-    )
-    for source, total in cursor.fetchall():
-        print(f"Source: {source}, Total: £{total:.2f} 💰")
+    # Show the user a breakdown of their expenses by type.
+    print("\nBreakdown of your expenses by type 🛍️:")
+    income_heading_shown = False
+    for kind, label, total in cursor:
+        if kind == "expense":
+            print(f"Type: {label}, Total: £{total:.2f}")
+            continue
+
+        # Show the user a breakdown of their incomes by type.
+        if not income_heading_shown:
+            print("\nBreakdown of your incomes by type 💼:")
+            income_heading_shown = True
+        print(f"Source: {label}, Total: £{total:.2f} 💰")
+
+    if not income_heading_shown:
+        print("\nBreakdown of your incomes by type 💼:")
 
     print("Returning to the main menu... 🔄\n")
-    link_to_db.close()
 
 
 def trends_for_tracking_spending():
@@ -1131,22 +1950,21 @@ def trends_for_tracking_spending():
     Return:
         None
     """
-    link_to_db = link_to_finance_db()
-    cursor = link_to_db.cursor()
-
     print("\nTrends in spending")
-    cursor.execute(
-        "SELECT strftime('%Y-%m', date_of_spending), SUM(amount_spent) "
+    # The monthly totals are reused until the next write to the db.
+    monthly_totals = _cached_query(
+        ("trends",),
+        "SELECT strftime('%Y-%m', date_of_spending), "
+        "SUM(amount_spent_pennies) / 100.0 "
         "FROM users_expenses GROUP BY strftime('%Y-%m', date_of_spending)"
     )
 
     # A loop through query results and as a result displaying the spending
     # trends.
-    for month, total in cursor.fetchall():
+    for month, total in monthly_totals:
         print(f"Month: {month}, Total Expenses: £{total:.2f}")
 
     print("Returning to the main menu... 🔄\n")
-    link_to_db.close()
 
 
 # ===================== Financial Goal Management ======================
@@ -1171,27 +1989,16 @@ def personalised_financial_goal(name_of_goal, desired_amount,
     """
 
     # Normalise input to lowercase for consistency.
-    name_of_goal = name_of_goal.strip().lower()
+    name_of_goal = _norm(name_of_goal)
 
     # Function to ensure the finish goal's end date occurs after start date.
-    if datetime.strptime(finish_date, "%Y-%m-%d") <= datetime.strptime(
-                         commencing_date, "%Y-%m-%d"):
+    if _to_day(finish_date) <= _to_day(commencing_date):
         print("🚩 End date must be after the start date.")
         return
 
-    link_to_db = link_to_finance_db()
-    cursor = link_to_db.cursor()
-
     # Store the goal in the database with an initial saved amount of 0 as well.
-    cursor.execute(
-        '''INSERT INTO saving_goals
-           (name_of_goal, monthly_target_amount, saved_up_so_far,
-            commencing_date, finish_date)
-           VALUES (?, ?, ?, ?, ?)''',
-        (name_of_goal, desired_amount, 0, commencing_date, finish_date)
-    )
-
-    link_to_db.commit()
+    bulk_add_goals([(name_of_goal, desired_amount, commencing_date,
+                     finish_date)])
 
     # Confirm a message to the user that the goal has been generated.
     print(
@@ -1201,7 +2008,31 @@ def personalised_financial_goal(name_of_goal, desired_amount,
     )
 
     print("Returning to the main menu... 🔄\n")
-    link_to_db.close()
+
+
+def bulk_add_goals(goals):
+    """Saves many financial goals into the database at once.
+
+    Each goal starts with a saved amount of 0. The goals are inserted with
+    executemany in chunks of BULK_INSERT_CHUNK_SIZE, and each chunk is saved
+    in one transaction.
+
+    Args:
+        goals (iterable): Tuples of (name_of_goal, desired_amount,
+        commencing_date, finish_date) to save. Names should already be
+        normalised and the dates validated. Amounts are in pounds and are
+        stored as pennies. Dates are in YYYY-MM-DD format and are stored as
+        day numbers.
+
+    Raises:
+        sqlite3.Error: If the goals cannot be saved. The chunk that failed
+        is rolled back.
+    """
+    _bulk_insert(SQL_INSERT_GOAL,
+                 ((name_of_goal, _to_pennies(desired_amount),
+                   _to_day(commencing_date), _to_day(finish_date))
+                  for name_of_goal, desired_amount, commencing_date,
+                  finish_date in goals))
 
 
 def browse_goal_progress(name_of_goal):
@@ -1219,22 +2050,25 @@ def browse_goal_progress(name_of_goal):
 
     # Normalise input for consistency.
     # Gather all financial goal's target amount and saved amount.
-    name_of_goal = name_of_goal.strip().lower()
-    with sqlite3.connect("Spend_Wise_Buddy.db") as link_to_db:
-        cursor = link_to_db.cursor()
-        cursor.execute(
-            '''SELECT monthly_target_amount, saved_up_so_far
-               FROM saving_goals WHERE LOWER(name_of_goal) = ?''',
-            (name_of_goal,)
-            )
+    name_of_goal = _norm(name_of_goal)
+
+    # One db handle is used for both reading and updating the goal.
+    link_to_db = link_to_finance_db()
+    cursor = link_to_db.cursor()
+    cursor.execute(SQL_SELECT_GOAL, (name_of_goal,))
     result = cursor.fetchone()
 
     # Show the progress details, if the goal exists.
     if result:
-        desired_amount, saved_so_far = result
+        (goal_ID_No, desired_amount, saved_so_far, commencing_day,
+         finish_day) = result
         remaining_amount = desired_amount - saved_so_far
 
         print(f"🎯 Goal: {name_of_goal.capitalize()}")
+        # Goals saved without dates have no period to show.
+        if commencing_day and finish_day:
+            print(f"📆 Period: {_to_iso(commencing_day)} to "
+                  f"{_to_iso(finish_day)}")
         print(f"🏆 Total Target: £{desired_amount:.2f}")
         print(f"💰 Saved So Far: £{saved_so_far:.2f}")
         print(f"🚀 Remaining: £{remaining_amount:.2f}")
@@ -1245,35 +2079,28 @@ def browse_goal_progress(name_of_goal):
             add_more = input("Would you like to add savings towards this "
                              "goal? (Y/N): ").strip().lower()
             if add_more == "y":
-                try:
-                    new_savings = float(input("Enter the amount you want to "
-                                              "add 💰: £").strip())
-                    # Check that the savings amount is more than zero.
-                    if new_savings <= 0:
-                        print("🚩 Savings amount must be greater than zero.")
-                        return
-
-                    updated_savings = saved_so_far + new_savings
-
-                    # Connect to db to update saving progress.
-                    db_path = "Spend_Wise_Buddy.db"
-                    with sqlite3.connect(db_path) as link_to_db:
-
-                        cursor = link_to_db.cursor()
-                    cursor.execute(
-                            '''UPDATE saving_goals
-                               SET saved_up_so_far = ?
-                               WHERE LOWER(name_of_goal) = ?''',
-                            (updated_savings, name_of_goal)
-                        )
-                    link_to_db.commit()
+                new_savings = _parse_amount(input("Enter the amount you "
+                                                  "want to add 💰: £"))
+                if new_savings is None:
+                    print("🚩 Invalid input! Please enter a numeric value.")
+                # Check that the savings amount is more than zero.
+                elif new_savings <= 0:
+                    print("🚩 Savings amount must be greater than zero.")
+                    return
+                else:
+                    # Add to the saving progress in the db itself, so a value
+                    # read earlier can never overwrite a newer one. RETURNING
+                    # gives back the new total in the same statement.
+                    with link_to_db:
+                        cursor.execute("BEGIN IMMEDIATE")
+                        cursor.execute(SQL_ADD_GOAL_SAVINGS,
+                                       (_to_pennies(new_savings),
+                                        goal_ID_No))
+                        updated_savings, = cursor.fetchone()
 
                     print(f"✅ Added £{new_savings:.2f} to your savings!")
                     remaining_balance = desired_amount - updated_savings
                     print(f"🚀 Remaining Balance: £{remaining_balance:.2f}")
-
-                except ValueError:
-                    print("🚩 Invalid input! Please enter a numeric value.")
         else:
             print("🎉 Congratulations! You have reached your goal! 🏆")
 
@@ -1303,27 +2130,11 @@ def user_main_menu():
     trends.
     """
     while True:
-        print("\n✨ Hello, annyeonghaseyo and Welcome to Spend Wise Buddy! ✨")
-        print("1️⃣  Expenses (Register, View, Update, Delete 📝📊🔍)")
-        print("2️⃣  Income (Register, View, Update, Delete 💵💰🔎)")
-        print("3️⃣  Budget Management (Set and view budgets 🎯🏦)")
-        print("4️⃣  Financial Goals (Set and track your financial goals 🚀)")
-        print("5️⃣  Reports & Trends (Summaries, Breakdown & trends 📈)")
-        print("6️⃣  Quit Program (Exit the application ❌)")
+        sys.stdout.write(MAIN_MENU_TEXT)
 
         choice = input("\nEnter your choice (1-6): ").strip()
 
-        if choice == "1":
-            expenses_menu()
-        elif choice == "2":
-            income_menu()
-        elif choice == "3":
-            budget_menu()
-        elif choice == "4":
-            goals_menu()
-        elif choice == "5":
-            reports_menu()
-        elif choice == "6":
+        if choice == "6":
             print("👋🏽 Au Revoir, Thank you for choosing Spend Wise Buddy. 😎🌟")
             restart = input("Would you like to restart the application? "
                             "(Y/N): ").strip().lower()
@@ -1331,200 +2142,207 @@ def user_main_menu():
                 continue
             else:
                 break
+
+        # Look the sub-menu up in MAIN_MENU_ACTIONS instead of comparing the
+        # choice against every option in turn.
+        menu = MAIN_MENU_ACTIONS.get(choice)
+        if menu:
+            menu()
         else:
             print("🚩 Invalid choice! Please select an option from 1-6.")
 
 
-# Expenses Menu
-def expenses_menu():
-    print("\n-- Expenses Menu --")
-    print("1️⃣ Add new expense 📝")
-    print("2️⃣ Add a new expense category 🏷️")
-    print("3️⃣ View expenses 📊")
-    print("4️⃣ Update an expense 🔄")
-    print("5️⃣ Delete an expense category 🚫")
-    print("0️⃣ Return to Main Menu 🔙")
+def _add_expense_category_prompt():
+    """Asks for a new expense category name and adds it."""
+    category_name = input("Enter the new expense category name: ").strip()
+    if category_name:
+        add_expense_category(category_name)
+    else:
+        print("🚩 Category name cannot be empty!")
 
-    choice = input("Enter your choice: ")
 
-    if choice == "1":
-        record_new_spending()
-    elif choice == "2":
-        category_name = input("Enter the new expense category name: ").strip()
-        if category_name:
-            add_expense_category(category_name)
-        else:
-            print("🚩 Category name cannot be empty!")
-    elif choice == "3":
-        check_expenses()
-    elif choice == "4":
-        update_my_spending()
-    elif choice == "5":
-        delete_spending_type()
-    elif choice == "0":
-        return
-    else:
-        print("🚩 Invalid option!")
+def _set_budget_prompt():
+    """Asks for a category, budget and category type and saves the budget."""
+    category_name = _norm(input("Enter category name (e.g., Salary, "
+                                "Food): "))
 
+    budget_value = _parse_amount(input(f"Enter budget for "
+                                       f"'{category_name}': £"))
+    if budget_value is None:
+        print("🚩 Invalid input! Please enter a numeric value.")
+        return
+    if budget_value <= 0:
+        print("🚩 Budget must be greater than zero.")
+        return
 
-# Income Menu
-def income_menu():
-    print("\n-- Income Menu --")
-    print("1️⃣ Add income 💵")
-    print("2️⃣ Add a new income category 🏷️")
-    print("3️⃣ View income 💰")
-    print("4️⃣ Update income 💼")
-    print("5️⃣ Delete an income category 🚫")
-    print("0️⃣ Return to Main Menu 🔙")
+    category_type = input("Income or expense? "
+                          "(income/expense): ").strip().lower()
 
-    choice = input("Enter your choice: ").strip()
-    if choice == "1":
-        record_an_income()
-    elif choice == "2":
-        add_income_category()
-    elif choice == "3":
-        check_income()
-    elif choice == "4":
-        update_my_income()
-    elif choice == "5":
-        delete_income_type()
-    elif choice == "0":
+    try:
+        set_budget_for_category(category_name, budget_value, category_type)
+    except ValueError as e:
+        print(f"🚩 {e}")
+
+
+def _display_budget_prompt():
+    """Asks for a category and its type and shows its budget."""
+    category_name = _norm(input("Enter category name (e.g., Salary, "
+                                "Food): "))
+    category_type = input("Is this category income or expense? "
+                          "(income/expense): ").strip().lower()
+    display_category_budget(category_name, category_type)
+
+
+def _set_goal_prompt():
+    """Asks for the details of a personalised financial goal and saves it."""
+    # Ask for the goal name clearly.
+    goal_name = input("Enter the goal name 🎯: ").strip()
+
+    # Convert user's input into a numercial value (float).
+    target_amount = _parse_amount(input("Enter the target amount 💰: £"))
+    if target_amount is None:
+        # If the input is not numeric, clearly displays an error message
+        # and return
+        print("🚩 Invalid input! Please enter a numeric amount.")
+        return
+    # Check that the goal amount is more than zero.
+    if target_amount <= 0:
+        print("🚩 Goal amount must be greater than zero.")
         return
-    else:
-        print("🚩 Invalid option!")
 
+    # Allow user to enter start and end dates for financial goal.
+    start_date = input("Enter start date (YYYY-MM-DD) 📆: ").strip()
+    end_date = input("Enter end date (YYYY-MM-DD) 📆: ").strip()
 
-# Budget Management Menu
-def budget_menu():
-    print("\n-- Budget Management Menu --")
-    print("1️⃣ Set budget for a category 🎯")
-    print("2️⃣ View budget for a category 🏦")
-    print("3️⃣ Magical budget calculator 🧙🪄")
-    print("0️⃣ Return to Main Menu 🔙")
+    # Inform user if the date format is invalid.
+    if not (validate_date(start_date) and validate_date(end_date)):
+        print("🚩 Invalid date format! Please use YYYY-MM-DD.")
+        return
 
-    choice = input("Enter your choice: ").strip()
-    if choice == "1":
-        category_name = input("Enter category name (e.g., Salary, "
-                              "Food): ").strip().lower()
-
-        try:
-            budget_value = float(input(f"Enter budget for '{category_name}': £"
-                                       ).strip())
-            if budget_value <= 0:
-                print("🚩 Budget must be greater than zero.")
-                return
-        except ValueError:
-            print("🚩 Invalid input! Please enter a numeric value.")
-            return
+    # Function to ensure the finish goal's end date occurs after start
+    # date.
+    if _to_day(end_date) <= _to_day(start_date):
+        print("🚩 End date must be after the start date.")
+        print("Please try again. 🔄\n")
+        return  # Stops the process and returns to menu
 
-        category_type = input("Income or expense? "
-                              "(income/expense): ").strip().lower()
+    # Function allows personalised_financial_goal() to clearly work after
+    # validation passes.
+    personalised_financial_goal(goal_name, target_amount, start_date,
+                                end_date)
 
-        try:
-            set_budget_for_category(category_name, budget_value, category_type)
-        except ValueError as e:
-            print(f"🚩 {e}")
 
-    elif choice == "2":
-        category_name = input("Enter category name (e.g., Salary, "
-                              "Food): ").strip().lower()
-        category_type = input("Is this category income or expense? "
-                              "(income/expense): ").strip().lower()
-        display_category_budget(category_name, category_type)
+def _goal_progress_prompt():
+    """Asks for a goal name so its savings progress can be viewed."""
+    goal_name = input("Enter the goal name 🎯: ").strip()
+    # Function to view and potentially update the goal.
+    browse_goal_progress(goal_name)
+
 
-    elif choice == "3":
-        magical_budget_calculator()
+def _run_menu_choice(actions, choice):
+    """Runs the function picked from a sub-menu.
 
-    elif choice == "0":
+    Args:
+        actions (dict): Maps each menu choice to the function it runs.
+        choice (str): The option entered by the user. "0" returns to the
+        main menu.
+    """
+    if choice == "0":
         return
 
+    action = actions.get(choice)
+    if action:
+        action()
     else:
+        # Handles any other unexpected user inputs.
         print("🚩 Invalid option!")
 
 
-# Personal Financial Goals Menu
-def goals_menu():
-    print("\n-- Financial Goals Menu --")
-    print("1️⃣ Set a personalised financial goal 🚀")
-    print("2️⃣ View or update savings progress 📈")
-    print("0️⃣ Return to Main Menu 🔙")
+# Expenses Menu
+def expenses_menu():
+    sys.stdout.write(EXPENSES_MENU_TEXT)
 
     choice = input("Enter your choice: ")
+    _run_menu_choice(EXPENSES_MENU_ACTIONS, choice)
 
-    # Option 1: Set a personalised financial goal.
-    if choice == "1":
-        # Ask for the goal name clearly.
-        goal_name = input("Enter the goal name 🎯: ").strip()
-
-        # Convert user's input into a numercial value (float).
-        try:
-            target_amount = float(input("Enter the target amount 💰: £"
-                                        ).strip())
-            # Check that the goal amount is more than zero.
-            if target_amount <= 0:
-                print("🚩 Goal amount must be greater than zero.")
-                return
-        except ValueError:
-            # If the input is not numeric, clearly displays an error message
-            # and return
-            print("🚩 Invalid input! Please enter a numeric amount.")
-            return
 
-        # Allow user to enter start and end dates for financial goal.
-        start_date = input("Enter start date (YYYY-MM-DD) 📆: ").strip()
-        end_date = input("Enter end date (YYYY-MM-DD) 📆: ").strip()
-
-        # Function to ensure the finish goal's end date occurs after start
-        # date.
-        try:
-            if datetime.strptime(end_date, "%Y-%m-%d") <= datetime.strptime(
-                                 start_date, "%Y-%m-%d"):
-                print("🚩 End date must be after the start date.")
-                print("Please try again. 🔄\n")
-                return  # Stops the process and returns to menu
-        except ValueError:
-            # Inform user if the date format is invalid.
-            print("🚩 Invalid date format! Please use YYYY-MM-DD.")
-            return
+# Income Menu
+def income_menu():
+    sys.stdout.write(INCOME_MENU_TEXT)
 
-        # Function allows personalised_financial_goal() to clearly work after
-        # validation passes.
-        personalised_financial_goal(goal_name, target_amount, start_date,
-                                    end_date)
+    choice = input("Enter your choice: ").strip()
+    _run_menu_choice(INCOME_MENU_ACTIONS, choice)
 
-    # Option 2: View or update existing savings progress.
-    elif choice == "2":
-        goal_name = input("Enter the goal name 🎯: ").strip()
-        # Function to view and potentially update the goal.
-        browse_goal_progress(goal_name)
 
-    # Option 0: Return to the main menu.
-    elif choice == "0":
-        return
+# Budget Management Menu
+def budget_menu():
+    sys.stdout.write(BUDGET_MENU_TEXT)
 
-    # Handles any other unxpected user inputs.
-    else:
-        print("🚩 Invalid option!")
+    choice = input("Enter your choice: ").strip()
+    _run_menu_choice(BUDGET_MENU_ACTIONS, choice)
+
+
+# Personal Financial Goals Menu
+def goals_menu():
+    sys.stdout.write(GOALS_MENU_TEXT)
+
+    choice = input("Enter your choice: ")
+    _run_menu_choice(GOALS_MENU_ACTIONS, choice)
 
 
 def reports_menu():
-    print("\n-- Reports & Trends Menu --")
-    print("1️⃣ View income and expense summary 📊 (Monthly/Annual)")
-    print("2️⃣ Track spending trends 📉")
-    print("3️⃣ View spending and income by category 🔍")
-    print("0️⃣ Return to Main Menu 🔙")
+    sys.stdout.write(REPORTS_MENU_TEXT)
 
     choice = input("Enter your choice: ").strip()
-    if choice == "1":
-        income_expenses_summary()
-    elif choice == "2":
-        trends_for_tracking_spending()
-    elif choice == "3":
-        type_of_spending_and_income()
-    elif choice == "0":
-        return
-    else:
-        print("🚩 Invalid option!")
+    _run_menu_choice(REPORTS_MENU_ACTIONS, choice)
+
+
+# The functions run by each menu option, keyed by the choice the user types.
+# They sit here, after every handler has been defined, so each menu picks its
+# action with one dict lookup rather than a long if/elif chain.
+MAIN_MENU_ACTIONS = {
+    "1": expenses_menu,
+    "2": income_menu,
+    "3": budget_menu,
+    "4": goals_menu,
+    "5": reports_menu,
+}
+
+EXPENSES_MENU_ACTIONS = {
+    "1": record_new_spending,
+    "2": _add_expense_category_prompt,
+    "3": check_expenses,
+    "4": update_my_spending,
+    "5": delete_spending_type,
+    "6": record_many_spendings,
+}
+
+INCOME_MENU_ACTIONS = {
+    "1": record_an_income,
+    "2": add_income_category,
+    "3": check_income,
+    "4": update_my_income,
+    "5": delete_income_type,
+}
+
+BUDGET_MENU_ACTIONS = {
+    "1": _set_budget_prompt,
+    "2": _display_budget_prompt,
+    "3": magical_budget_calculator,
+}
+
+GOALS_MENU_ACTIONS = {
+    "1": _set_goal_prompt,
+    "2": _goal_progress_prompt,
+}
+
+# Reports can run long over years of records, so they are wrapped to let
+# the user cancel them with Ctrl+C.
+REPORTS_MENU_ACTIONS = {
+    "1": functools.partial(_run_report, income_expenses_summary),
+    "2": functools.partial(_run_report, trends_for_tracking_spending),
+    "3": functools.partial(_run_report, type_of_spending_and_income),
+}
 
 
 # Run the menu if this script is executed.